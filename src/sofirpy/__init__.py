@@ -9,12 +9,14 @@ __all__ = [
     "BaseRecorder",
     "BaseSimulator",
     "FixedSizedRecorder",
+    "HDF5Recorder",
     "Run",
     "SimulationEntity",
     "VariableSizeRecorder",
     "export_dymola_model",
     "export_open_modelica_model",
     "plot_results",
+    "set_overwrite_policy",
     "simulate",
 ]
 
@@ -23,6 +25,12 @@ from .fmu_export.open_modelica_fmu_export import export_open_modelica_model
 from .rdm.hdf5.hdf5 import HDF5
 from .rdm.run import Run
 from .simulation.plot import plot_results
-from .simulation.recorder import BaseRecorder, FixedSizedRecorder, VariableSizeRecorder
+from .simulation.recorder import (
+    BaseRecorder,
+    FixedSizedRecorder,
+    HDF5Recorder,
+    VariableSizeRecorder,
+)
 from .simulation.simulation import BaseSimulator, simulate
 from .simulation.simulation_entity import SimulationEntity
+from .utils import set_overwrite_policy
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable, Sequence
 from enum import Enum
 from typing import Any, Literal, Optional, Union
 
@@ -38,6 +39,9 @@ ModelClasses: TypeAlias = SimulationEntityMapping
 
 ParametersToLog: TypeAlias = dict[str, list[str]]
 ParameterValue: TypeAlias = Union[bool, float, int, str, object]
+ParameterGetter: TypeAlias = Callable[[str], ParameterValue]
+ParameterSetter: TypeAlias = Callable[[str, ParameterValue], None]
+ParametersGetter: TypeAlias = Callable[[Sequence[str]], list[ParameterValue]]
 
 StartValueConfigLabel: Literal["start_values"] = "start_values"
 StartValue: TypeAlias = Union[ParameterValue, tuple[ParameterValue, str]]
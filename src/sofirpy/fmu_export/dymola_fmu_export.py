@@ -268,20 +268,18 @@ class DymolaFmuExport(FmuExport):
         parameters = self.format_parameters()
         input_par = ", ".join(parameters + self.model_modifiers)
 
-        model_dir_str = str(self.model_directory).replace("\\", "/")
-        model_path_str = str(self.model_path).replace("\\", "/")
-        log_path_str = str(self.simulator_log_path).replace("\\", "/")
-        error_path_str = str(self.error_log_path).replace("\\", "/")
-
-        mos_script = f'cd("{model_dir_str}");\n'
-
-        if self.packages:
-            for package in self.packages:
-                package_path_str = str(package).replace("\\", "/")
-                mos_script += f'openModel("{package_path_str}")\n'
-        mos_script += f'openModel("{model_path_str}");\n'
-        mos_script += f'modelInstance = "{self.model_name}(' + input_par + ')";\n'
-        mos_script += (
+        model_dir_str = self.model_directory.as_posix()
+        model_path_str = self.model_path.as_posix()
+        log_path_str = self.simulator_log_path.as_posix()
+        error_path_str = self.error_log_path.as_posix()
+
+        lines = [f'cd("{model_dir_str}");\n']
+        lines.extend(
+            f'openModel("{package.as_posix()}")\n' for package in self.packages
+        )
+        lines.append(f'openModel("{model_path_str}");\n')
+        lines.append(f'modelInstance = "{self.model_name}({input_par})";\n')
+        lines.append(
             "translateModelFMU("
             "modelInstance, "
             "false, "
@@ -293,13 +291,13 @@ class DymolaFmuExport(FmuExport):
             ");\n"
         )
         if export_simulator_log:
-            mos_script += f'savelog("{log_path_str}");\n'
+            lines.append(f'savelog("{log_path_str}");\n')
 
-        mos_script += "errors = getLastError();\n"
-        mos_script += f'Modelica.Utilities.Streams.print(errors, "{error_path_str}");\n'
-        mos_script += "Modelica.Utilities.System.exit();"
+        lines.append("errors = getLastError();\n")
+        lines.append(f'Modelica.Utilities.Streams.print(errors, "{error_path_str}");\n')
+        lines.append("Modelica.Utilities.System.exit();")
 
-        return mos_script
+        return "".join(lines)
 
     def create_mos_file(self, mos_script: str) -> None:
         """Create the mos file with the specified content.
@@ -321,30 +319,10 @@ class DymolaFmuExport(FmuExport):
         Returns:
             list[str]: List of parameters.
         """
-
-        def convert_to_modelica_value(value: ParameterValue) -> str:
-            if isinstance(value, str):
-                return value
-            if isinstance(value, bool):
-                return "true" if value else "false"
-            if isinstance(value, (int, float)):
-                return str(value)
-            if isinstance(value, list):
-                return (
-                    "{"
-                    + ", ".join(convert_to_modelica_value(element) for element in value)
-                    + "}"
-                )
-            raise TypeError(
-                f"value is {type(value)}; expected str, bool, float, int, list",
-            )
-
-        parameter_declaration = []
-        for parameter_name, parameter_value in self.parameters.items():
-            parameter_value = convert_to_modelica_value(parameter_value)
-            parameter_declaration.append(f"{parameter_name} = {parameter_value}")
-
-        return parameter_declaration
+        return [
+            f"{parameter_name} = {_to_modelica_value(parameter_value)}"
+            for parameter_name, parameter_value in self.parameters.items()
+        ]
 
     def move_files_to_output_directory(
         self,
@@ -496,6 +474,31 @@ def export_dymola_model(
         return dymola_exporter.fmu_path
 
 
+def _to_modelica_value(value: ParameterValue) -> str:
+    """Convert a parameter value to its Modelica representation.
+
+    Args:
+        value (ParameterValue): Parameter value.
+
+    Raises:
+        TypeError: type of value was not 'str', 'bool', 'int', 'float' or 'list'
+
+    Returns:
+        str: Modelica representation of the value.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, list):
+        return "{" + ", ".join(_to_modelica_value(element) for element in value) + "}"
+    raise TypeError(
+        f"value is {type(value)}; expected str, bool, float, int, list",
+    )
+
+
 def _validate_fmu_export_settings(
     fmi_version: Literal[1, 2],
     fmi_type: Literal["me", "cs", "all", "csSolver"],
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from types import TracebackType
-from typing import Final
+from typing import Any, Final
 
-from OMPython import ModelicaSystem
 from typing_extensions import Self
 
 import sofirpy.common as co
@@ -94,12 +94,9 @@ class OpenModelicaFmuExport(FmuExport):
         fmu_path = self._dump_directory / f"{model_path.stem}.fmu"
         super().__init__(model_path, fmu_path, output_directory)
         self.model_name = model_name
-
-        files_to_delete = [
-            f"{self.model_name}{file_name}" for file_name in self.files_to_delete
-        ]
-        self._paths_to_delete = [
-            self._dump_directory / file_name for file_name in files_to_delete
+        self._artifact_paths = [
+            self._dump_directory / f"{self.model_name}{suffix}"
+            for suffix in self.files_to_delete
         ]
 
     def export_fmu(self) -> bool:
@@ -107,16 +104,26 @@ class OpenModelicaFmuExport(FmuExport):
 
         Returns:
             bool: True if export is successful else False
+
+        Raises:
+            FmuExportError: OpenModelica did not create the FMU.
         """
-        open_modelica = ModelicaSystem(
-            str(self.model_path).replace("\\", "//"),
-            self.model_name,
-        )
+        # OMPython is imported here, since importing it is slow and only needed
+        # for OpenModelica exports, not for every 'import sofirpy'
+        from OMPython import ModelicaSystem
+
+        open_modelica = ModelicaSystem(self.model_path.as_posix(), self.model_name)
         _fmu_path = open_modelica.convertMo2Fmu()
         if not isinstance(_fmu_path, str):
             return False
-        utils.move_file(Path(_fmu_path), self.fmu_path)
-        return self.fmu_path.exists()
+        try:
+            utils.move_file(Path(_fmu_path), self.fmu_path)
+        except FileNotFoundError as error:
+            raise FmuExportError(
+                f"OpenModelica did not create the FMU at {_fmu_path}: "
+                f"{_get_omc_error_string(open_modelica)}"
+            ) from error
+        return True
 
     def __enter__(self) -> Self:
         return self
@@ -127,7 +134,40 @@ class OpenModelicaFmuExport(FmuExport):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        utils.delete_paths(self._paths_to_delete)
+        try:
+            self.delete_build_artifacts()
+        except OSError:
+            # a failed cleanup must not hide the error that ended the export
+            if exc_type is None:
+                raise
+            logging.warning(
+                f"Build artifacts of {self.model_name} could not be deleted.",
+                exc_info=True,
+            )
+
+    def delete_build_artifacts(self) -> None:
+        """Delete the files OpenModelica created in the dump directory.
+
+        Artifacts that were not created are skipped.
+        """
+        utils.delete_paths(self._artifact_paths)
+
+
+def _get_omc_error_string(open_modelica: Any) -> str:
+    """Get the error messages OpenModelica collected since the last query.
+
+    Args:
+        open_modelica (Any): OMPython ModelicaSystem the model was exported with.
+
+    Returns:
+        str: Error messages of OpenModelica.
+    """
+    # OMPython >= 4 exposes sendExpression on the ModelicaSystem, older versions
+    # only on the OMC session
+    send_expression = getattr(open_modelica, "sendExpression", None)
+    if send_expression is None:
+        send_expression = open_modelica.getconn.sendExpression
+    return str(send_expression("getErrorString()"))
 
 
 def export_open_modelica_model(
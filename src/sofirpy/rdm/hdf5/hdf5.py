@@ -4,20 +4,33 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
 import h5py
+import numpy as np
+import numpy.typing as npt
 from typing_extensions import Self
 
 import sofirpy.common as co
 from sofirpy import utils
 
+HDF5_SUFFIXES = (".hdf", ".h4", ".hdf4", ".he2", ".h5", ".hdf5", ".he5")
+
 
 class HDF5:
     """Object representing a HDF5 file.
 
+    The object can be used as a context manager. Inside the with block the file is
+    opened once and all operations share this handle instead of opening and
+    closing the file on every call.
+
+    >>> with HDF5(hdf5_path) as hdf5:
+    ...     hdf5.store_data(data, "data", "group")
+    ...     hdf5.append_attributes(attributes, "group/data")
+
     Args:
         hdf5_path (co.FilePath): Path to a hdf5 file. If it doesn't
             exists it will be created.
@@ -25,6 +38,33 @@ class HDF5:
 
     def __init__(self, hdf5_path: co.FilePath) -> None:
         self.hdf5_path = hdf5_path  # type: ignore[assignment]
+        self._hdf5_file: h5py.File | None = None
+        self._session_depth = 0
+
+    def __enter__(self) -> Self:
+        if self._session_depth == 0:
+            self._hdf5_file = h5py.File(str(self.hdf5_path), "a")
+        self._session_depth += 1
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._session_depth -= 1
+        if self._session_depth == 0 and self._hdf5_file is not None:
+            self._hdf5_file.close()
+            self._hdf5_file = None
+
+    @contextmanager
+    def _open(self) -> Iterator[h5py.File]:
+        """Yield the file handle of the current session or open the file.
+
+        Yields:
+            h5py.File: Opened hdf5 file.
+        """
+        if self._hdf5_file is not None:
+            yield self._hdf5_file
+            return
+        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+            yield hdf5
 
     @property
     def hdf5_path(self) -> Path:
@@ -48,12 +88,10 @@ class HDF5:
         """
         _hdf5_path = utils.convert_str_to_path(hdf5_path, "hdf5_path")
 
-        hdf_suffixes = [".hdf", ".h4", ".hdf4", ".he2", ".h5", ".hdf5", ".he5"]
-
-        if _hdf5_path.suffix not in hdf_suffixes:
+        if _hdf5_path.suffix not in HDF5_SUFFIXES:
             raise ValueError(
                 "Invalid path name, expected one of the following file extensions: "
-                f"{', '.join(hdf_suffixes)}",
+                f"{', '.join(HDF5_SUFFIXES)}",
             )
         if not _hdf5_path.exists():
             _hdf5_path.touch()
@@ -65,6 +103,7 @@ class HDF5:
         self,
         group_path: str,
         attributes: dict[str, Any] | None = None,
+        exist_ok: bool = False,
     ) -> None:
         """Creates a group in the hdf5 file.
 
@@ -82,17 +121,21 @@ class HDF5:
 
                 >>> group_path = "group2/subgroup1/subsubgroup1"
             attributes: (dict[str, Any] | None): Attributes for the group. Default None.
+            exist_ok (bool, optional): If True an already existing group is reused
+                instead of raising an error. Defaults to False.
 
         Raises:
-            ValueError: If the group already exists.
+            ValueError: If the group already exists and exist_ok is False.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
-            if group_path in hdf5:
+        with self._open() as hdf5:
+            if exist_ok:
+                group = hdf5.require_group(group_path)
+            elif group_path in hdf5:
                 raise ValueError(f"Group '{group_path}' already exists in hdf5.")
-            group = hdf5.create_group(group_path)
+            else:
+                group = hdf5.create_group(group_path)
             if attributes is not None:
-                for name, attr in attributes.items():
-                    group.attrs[name] = attr
+                group.attrs.update(attributes)
 
     def store_data(
         self,
@@ -100,6 +143,10 @@ class HDF5:
         data_name: str,
         group_path: str | None = None,
         attributes: dict[str, Any] | None = None,
+        dtype: npt.DTypeLike | None = None,
+        compression: str | None = None,
+        compression_opts: Any = None,
+        maxshape: tuple[int | None, ...] | None = None,
     ) -> None:
         """Stores data in a hdf5 group. If the group doesn't exist it will be created.
 
@@ -110,23 +157,34 @@ class HDF5:
             attributes (dict[str, Any] | None, optional): Data attributes dictionary
                 with attribute names as keys and the attributes as values.
                 Defaults to None.
+            dtype (npt.DTypeLike | None, optional): Data type the data is stored
+                with, e.g. np.float32 to halve the size of float64 data. If None the
+                data type of the data is used. Defaults to None.
+            compression (str | None, optional): Compression filter for non empty
+                numeric arrays. Compression makes writing and reading considerably
+                slower. "gzip" is a standard HDF5 filter readable by any HDF5 tool,
+                the faster "lzf" filter is only available in h5py. If None the data
+                is stored uncompressed. Defaults to None.
+            compression_opts (Any, optional): Options of the compression filter,
+                e.g. the gzip level 0-9. Defaults to None.
+            maxshape (tuple[int | None, ...] | None, optional): Maximum shape of
+                the dataset. Axes set to None are unlimited, so data can be added
+                with append_data. If None the dataset can not be resized.
+                Defaults to None.
 
         Raises:
             ValueError: If data path already exists.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             if (
                 not group_path
             ):  # if group path is empty, the data will be stored at the top level
                 group = hdf5
                 data_path = data_name
             else:
-                if group_path not in hdf5:
-                    group = hdf5.create_group(group_path)
-                else:
-                    group = hdf5[group_path]
+                group = hdf5.require_group(group_path)
                 data_path = f"{group_path}/{data_name}"
-            if data_path in hdf5:
+            if data_name in group:
                 overwrite = utils.get_user_input_for_overwriting(
                     data_path,
                     "hdf5 dataset at",
@@ -136,11 +194,42 @@ class HDF5:
                         "Unable to create dataset, "
                         f"dataset at {data_path} already exists.",
                     )
-                del hdf5[data_path]
-            dset = group.create_dataset(data_name, data=data)
+                del group[data_name]
+            dset = group.create_dataset(
+                data_name,
+                data=data,
+                dtype=dtype,
+                **_get_dataset_storage_options(
+                    data, compression, compression_opts, maxshape
+                ),
+            )
             if attributes:
-                for name, attr in attributes.items():
-                    dset.attrs[name] = attr
+                dset.attrs.update(attributes)
+
+    def append_data(
+        self,
+        data: npt.NDArray[Any],
+        data_name: str,
+        group_path: str | None = None,
+    ) -> None:
+        """Append data along the first axis of a resizable dataset.
+
+        Args:
+            data (npt.NDArray[Any]): Data that should be appended.
+            data_name (str): Name of the data.
+            group_path (str | None, optional): Path to the hdf5 group.
+
+        Raises:
+            ValueError: If data path does not lead to a hdf5 Dataset.
+        """
+        with self._open() as hdf5:
+            data_path = f"{group_path}/{data_name}" if group_path else data_name
+            dataset = hdf5.get(data_path)
+            if not isinstance(dataset, h5py.Dataset):
+                raise ValueError(f"'{data_path}' does not lead to a Dataset.")
+            start = dataset.shape[0]
+            dataset.resize(start + len(data), axis=0)
+            dataset[start:] = data
 
     def append_attributes(
         self,
@@ -154,10 +243,9 @@ class HDF5:
                 names as keys and the attributes as values
             path (str | None, optional): hdf5 path to the dataset or group.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             hdf5_object = hdf5[path] if path else hdf5
-            for name, attr in attributes.items():
-                hdf5_object.attrs[name] = attr
+            hdf5_object.attrs.update(attributes)
 
     def delete_attribute(self, attribute_name: str, path: str | None = None) -> None:
         """Deletes a attribute of a hdf5 Dataset or Group.
@@ -169,7 +257,7 @@ class HDF5:
         Raises:
             KeyError: If the attribute does not exist.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             hdf5_object: h5py.Group | h5py.Dataset = hdf5[path] if path else hdf5
             if attribute_name not in hdf5_object.attrs:
                 raise KeyError(
@@ -188,7 +276,7 @@ class HDF5:
         Returns:
             dict[str, Any]: Attributes of the given hdf5 group or dataset.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             hdf5_object: h5py.Group | h5py.Dataset = hdf5[path] if path else hdf5
             return dict(hdf5_object.attrs)
 
@@ -213,7 +301,7 @@ class HDF5:
             Any | tuple[Any, dict[str, Any]]: Data and/or attributes of
             the Dataset.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             data_path = f"{group_path}/{data_name}" if group_path else data_name
             dataset = hdf5.get(data_path)
 
@@ -238,7 +326,7 @@ class HDF5:
             KeyError: If the hdf5 path doesn't exists.
             ValueError: If the group_path does not lead to hdf5 Group.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             group = hdf5[group_path] if group_path else hdf5
             if not isinstance(group, h5py.Group):
                 raise ValueError(f"'{group_path}' does not lead to a hdf5 Group.")
@@ -256,7 +344,7 @@ class HDF5:
             ValueError: If the hdf5 path to the data does not lead to hdf5
                 Dataset.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             data_path = f"{group_path}/{data_name}" if group_path else data_name
             data_object = hdf5[data_path]
             if not isinstance(data_object, h5py.Dataset):
@@ -285,7 +373,7 @@ class HDF5:
         def append_dataset(name: str, hdf5_object: h5py.Group | h5py.Dataset) -> None:
             self._place(name, datasets, hdf5_object, mode="full")
 
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             group = hdf5[group_path] if group_path else hdf5
             if not isinstance(group, h5py.Group):
                 raise ValueError(f"'{group_path}' does not lead to a hdf5 Group.")
@@ -315,7 +403,7 @@ class HDF5:
         def append_name(name: str, hdf5_object: h5py.Group | h5py.Dataset) -> None:
             self._place(name, file_structure, hdf5_object, mode="short")
 
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             if group_path:
                 group = hdf5.get(group_path)
                 if not isinstance(group, h5py.Group):
@@ -336,10 +424,8 @@ class HDF5:
         Returns:
             bool: True if the path exists else False.
         """
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
-            if hdf5.get(path) is None:
-                return False
-        return True
+        with self._open() as hdf5:
+            return path in hdf5
 
     def _get_group_or_dataset_names(
         self,
@@ -347,16 +433,20 @@ class HDF5:
         obj: type[h5py.Group | h5py.Dataset],
         filter_func: Callable[[str], bool] | None = None,
     ) -> list[str]:
-        with h5py.File(str(self.hdf5_path), "a") as hdf5:
+        with self._open() as hdf5:
             group = hdf5[group_path] if group_path else hdf5
             if not isinstance(group, h5py.Group):
                 raise ValueError(f"'{group_path}' does not lead to a hdf5 Group.")
             if filter_func is None:
-                return [name for name in group if isinstance(group[name], obj)]
+                return [
+                    name
+                    for name, hdf5_object in group.items()
+                    if isinstance(hdf5_object, obj)
+                ]
             return [
                 name
-                for name in group
-                if isinstance(group[name], obj) and filter_func(group[name])
+                for name, hdf5_object in group.items()
+                if isinstance(hdf5_object, obj) and filter_func(hdf5_object)
             ]
 
     def get_group_names(
@@ -439,6 +529,47 @@ class HDF5:
         return _dict
 
 
+def _get_dataset_storage_options(
+    data: Any,
+    compression: str | None = None,
+    compression_opts: Any = None,
+    maxshape: tuple[int | None, ...] | None = None,
+) -> dict[str, Any]:
+    """Get the storage options for a dataset.
+
+    Non empty or resizable numeric arrays are stored chunked and compressed with
+    the given filter. Scalars, strings and object data are stored with the default
+    layout.
+
+    Args:
+        data (Any): Data that should be stored.
+        compression (str | None, optional): Compression filter. If None the data
+            is stored with the default layout. Defaults to None.
+        compression_opts (Any, optional): Options of the compression filter.
+            Defaults to None.
+        maxshape (tuple[int | None, ...] | None, optional): Maximum shape of the
+            dataset. Defaults to None.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for h5py.Group.create_dataset.
+    """
+    options: dict[str, Any] = {} if maxshape is None else {"maxshape": maxshape}
+    if (
+        compression is not None
+        and isinstance(data, np.ndarray)
+        and data.ndim > 0
+        and (data.size > 0 or maxshape is not None)
+        and data.dtype.kind not in ("O", "U")
+    ):
+        options.update(
+            chunks=True,
+            compression=compression,
+            compression_opts=compression_opts,
+            shuffle=True,
+        )
+    return options
+
+
 @dataclass
 class HDF5Object:
     name: str
@@ -561,8 +692,7 @@ class Group(HDF5Object):
         return self
 
     def to_hdf5(self, hdf5: HDF5, overwrite: bool = False) -> None:
-        if self.path not in hdf5:
-            hdf5.create_group(self.path)
+        hdf5.create_group(self.path, exist_ok=True)
         self._attribute_to_hdf5(hdf5)
         self._groups_to_hdf5(hdf5)
         self._datasets_to_hdf5(hdf5)
@@ -22,8 +22,9 @@ class RunToHDF5:
     def store(cls, hdf5_path: Path, run: rdm_run.Run) -> None:
         hdf5 = h5.HDF5(hdf5_path=hdf5_path)
         self = cls(hdf5=hdf5, run=run)
-        self._init_hdf5()
-        self._run_to_hdf5()
+        with hdf5:
+            self._init_hdf5()
+            self._run_to_hdf5()
 
     def _init_hdf5(self) -> None:
         if self._is_initialized():
@@ -89,9 +90,12 @@ class RunToHDF5:
         try:
             run_group.to_hdf5(self.hdf5)
             model_storage_group.to_hdf5(self.hdf5)
-        except Exception as e:
-            run_group.delete(self.hdf5)
-            raise e
+        except Exception:
+            # the run group might not have been created yet; deleting it
+            # unconditionally would mask the original error with a KeyError
+            if run_group.path in self.hdf5:
+                run_group.delete(self.hdf5)
+            raise
         logging.info(
             f"Successfully created run '{self.run.run_name}' at '{self.hdf5.hdf5_path}'",
         )
@@ -92,8 +92,11 @@ class FmuReference(DatasetSerializer):
     @staticmethod
     def serialize(run: rdm_run.Run, *args: Any, **kwargs: Any) -> Any:
         fmu_path = run.get_fmu_path(kwargs["fmu_name"])
-        fmu_content = fmu_path.read_bytes()
-        return hashlib.sha256(fmu_content).hexdigest()
+        fmu_hash = hashlib.sha256()
+        with fmu_path.open("rb") as fmu_file:
+            for chunk in iter(lambda: fmu_file.read(1 << 20), b""):
+                fmu_hash.update(chunk)
+        return fmu_hash.hexdigest()
 
 
 class FmuStorage(DatasetSerializer):
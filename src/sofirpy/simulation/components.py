@@ -3,12 +3,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 from sofirpy.simulation.simulation_entity import SimulationEntity
 
 
+class _FrozenSlots:
+    """Copy and pickle support for frozen dataclasses with __slots__.
+
+    Without a __dict__ the state is restored slot by slot with setattr, which a
+    frozen dataclass forbids.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
 @dataclass(frozen=True)
-class System:
+class System(_FrozenSlots):
     """System object representing a simulation entity.
 
     Args:
@@ -16,12 +34,14 @@ class System:
             name (str): name of the system
     """
 
+    __slots__ = ("name", "simulation_entity")
+
     simulation_entity: SimulationEntity
     name: str
 
 
 @dataclass(frozen=True)
-class SystemParameter:
+class SystemParameter(_FrozenSlots):
     """SystemParameter object representing a parameter in a system.
 
     Args:
@@ -29,12 +49,14 @@ class SystemParameter:
             name (str): name of the parameter
     """
 
+    __slots__ = ("name", "system_name")
+
     system_name: str
     name: str
 
 
 @dataclass(frozen=True)
-class Connection:
+class Connection(_FrozenSlots):
     """Representing a connection between two systems.
 
     Args:
@@ -44,5 +66,7 @@ class Connection:
             represents an output of a system
     """
 
+    __slots__ = ("input_point", "output_point")
+
     input_point: SystemParameter
     output_point: SystemParameter
@@ -1,4 +1,5 @@
 import pathlib as pl
+from typing import Final
 
 import pydantic
 from typing_extensions import Self
@@ -20,12 +21,12 @@ class BaseSimulationConfig(pydantic.BaseModel):
     @pydantic.field_validator("fmu_paths", mode="before")
     @classmethod
     def validate_fmu_paths_exist(cls, fmu_paths: co.FmuPaths) -> dict[str, pl.Path]:
-        _fmu_paths: dict[str, pl.Path] = {
-            name: pl.Path(path) for name, path in fmu_paths.items()
-        }
-        for name, path in _fmu_paths.items():
-            if not path.exists():
-                raise FileNotFoundError(f"FMU {name!r} not found at {path}")
+        _fmu_paths: dict[str, pl.Path] = {}
+        for name, path in fmu_paths.items():
+            _path = path if isinstance(path, pl.Path) else pl.Path(path)
+            if not _path.exists():
+                raise FileNotFoundError(f"FMU {name!r} not found at {_path}")
+            _fmu_paths[name] = _path
         return _fmu_paths
 
     @pydantic.model_validator(mode="after")
@@ -46,14 +47,16 @@ class BaseSimulationConfig(pydantic.BaseModel):
 
     @pydantic.model_validator(mode="after")
     def check_system_in_connection_exists(self) -> Self:
+        system_names = self.system_names
+        connected_system_key: Final = co.ConnectionKeys.CONNECTED_SYSTEM.value
         for system_name, connections in self.connections.items():
-            if system_name not in self.system_names:
+            if system_name not in system_names:
                 raise ValueError(
                     f"System {system_name!r} in connections does not exist."
                 )
             for connection in connections:
-                connected_system = connection[co.ConnectionKeys.CONNECTED_SYSTEM.value]
-                if connected_system not in self.system_names:
+                connected_system = connection[connected_system_key]
+                if connected_system not in system_names:
                     raise ValueError(
                         f"System {connected_system!r} in connections does not exist."
                     )
@@ -61,8 +64,9 @@ class BaseSimulationConfig(pydantic.BaseModel):
 
     @pydantic.model_validator(mode="after")
     def check_systems_in_init_config_exists(self) -> Self:
+        system_names = self.system_names
         for system_name in self.init_configs:
-            if system_name not in self.system_names:
+            if system_name not in system_names:
                 raise ValueError(
                     f"System {system_name!r} in init_configs does not exist."
                 )
@@ -70,8 +74,9 @@ class BaseSimulationConfig(pydantic.BaseModel):
 
     @pydantic.model_validator(mode="after")
     def check_system_in_parameters_to_log_exists(self) -> Self:
+        system_names = self.system_names
         for system_name in self.parameters_to_log:
-            if system_name not in self.system_names:
+            if system_name not in system_names:
                 raise ValueError(
                     f"System {system_name!r} in parameters_to_log does not exist."
                 )
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Callable, TypeVar
 
 import pydantic
 from fmpy import extract, read_model_description
 from fmpy.fmi2 import FMU2Slave
+from fmpy.model_description import ModelDescription
 from fmpy.simulation import (
     apply_start_values,
     settable_in_initialization_mode,
@@ -20,6 +24,7 @@ from sofirpy.simulation.simulation_entity import SimulationEntity
 
 SetterFunction = Callable[[list[int], list[co.ParameterValue]], None]
 GetterFunction = Callable[[list[int]], list[co.ParameterValue]]
+AccessorFunction = TypeVar("AccessorFunction", SetterFunction, GetterFunction)
 
 
 class FmuInitConfig(pydantic.BaseModel):
@@ -73,7 +78,10 @@ class Fmu(SimulationEntity):
         Args:
             start_time (float, optional): start time. Defaults to 0.
         """
-        self.model_description = read_model_description(self.fmu_path)
+        fmu_stat = self.fmu_path.stat()
+        self.model_description = _read_model_description(
+            os.fspath(self.fmu_path), fmu_stat.st_mtime_ns, fmu_stat.st_size
+        )
         self.model_description_dict = {
             variable.name: variable
             for variable in self.model_description.modelVariables
@@ -96,6 +104,11 @@ class Fmu(SimulationEntity):
             "Integer": self.fmu.getInteger,
             "Real": self.fmu.getReal,
         }
+        self._parameter_setters: dict[str, tuple[SetterFunction, list[int]]] = {}
+        self._parameter_getters: dict[str, tuple[GetterFunction, list[int]]] = {}
+        self._parameters_getters: dict[
+            tuple[str, ...], list[tuple[GetterFunction, list[int], list[int]]]
+        ] = {}
         self.fmu.instantiate()
         self.fmu.setupExperiment()
         not_set_start_values = apply_start_values(
@@ -123,11 +136,12 @@ class Fmu(SimulationEntity):
         parameter_name: str,
         parameter_value: co.ParameterValue,
     ) -> None:
-        var_type = self.model_description_dict[parameter_name].type
-        self.setter_functions[var_type](
-            [self.model_description_dict[parameter_name].valueReference],
-            [parameter_value],
-        )
+        setter = self._parameter_setters.get(parameter_name)
+        if setter is None:
+            setter = self._resolve_accessor(parameter_name, self.setter_functions)
+            self._parameter_setters[parameter_name] = setter
+        set_values, value_references = setter
+        set_values(value_references, [parameter_value])
 
     def get_parameter_value(self, parameter_name: str) -> co.ParameterValue:
         """Return the value of a parameter.
@@ -139,12 +153,85 @@ class Fmu(SimulationEntity):
         Returns:
             ParameterValue: value of the parameter
         """
-        var_type = self.model_description_dict[parameter_name].type
-        value: co.ParameterValue = self.getter_functions[var_type](
-            [self.model_description_dict[parameter_name].valueReference],
-        )[0]
+        getter = self._parameter_getters.get(parameter_name)
+        if getter is None:
+            getter = self._resolve_accessor(parameter_name, self.getter_functions)
+            self._parameter_getters[parameter_name] = getter
+        get_values, value_references = getter
+        value: co.ParameterValue = get_values(value_references)[0]
         return value
 
+    def get_parameter_values(
+        self, parameter_names: Sequence[str]
+    ) -> list[co.ParameterValue]:
+        """Return the values of multiple parameters.
+
+        The parameters are grouped by their variable type, so that only one fmu call
+        per type is needed.
+
+        Args:
+            parameter_names (Sequence[str]): names of the parameters whose values
+                are to be obtained
+
+        Returns:
+            list[ParameterValue]: values of the parameters in the given order
+        """
+        parameter_names = tuple(parameter_names)
+        getters = self._parameters_getters.get(parameter_names)
+        if getters is None:
+            getters = self._parameters_getters[parameter_names] = (
+                self._group_getters_by_type(parameter_names)
+            )
+        values: list[co.ParameterValue] = [None] * len(parameter_names)
+        for get_values, value_references, positions in getters:
+            for position, value in zip(positions, get_values(value_references)):
+                values[position] = value
+        return values
+
+    def _group_getters_by_type(
+        self, parameter_names: tuple[str, ...]
+    ) -> list[tuple[GetterFunction, list[int], list[int]]]:
+        """Group parameters by variable type for reading them in bulk.
+
+        Args:
+            parameter_names (tuple[str, ...]): names of the parameters
+
+        Returns:
+            list[tuple[GetterFunction, list[int], list[int]]]: For each variable type
+            the typed getter function, the value references and the positions of
+            the parameters in parameter_names.
+        """
+        groups: dict[str, tuple[list[int], list[int]]] = {}
+        for position, parameter_name in enumerate(parameter_names):
+            variable = self.model_description_dict[parameter_name]
+            value_references, positions = groups.setdefault(variable.type, ([], []))
+            value_references.append(variable.valueReference)
+            positions.append(position)
+        return [
+            (self.getter_functions[var_type], value_references, positions)
+            for var_type, (value_references, positions) in groups.items()
+        ]
+
+    def _resolve_accessor(
+        self, parameter_name: str, functions: dict[str, AccessorFunction]
+    ) -> tuple[AccessorFunction, list[int]]:
+        """Look up the typed fmu function and the value reference of a parameter.
+
+        The result is cached by the caller, so the model description only has to be
+        queried on the first access of a parameter.
+
+        Args:
+            parameter_name (str): name of the parameter
+            functions (dict[str, AccessorFunction]): setter or getter functions by
+                variable type
+
+        Returns:
+            tuple[AccessorFunction, list[int]]: typed fmu function and the value
+            reference of the parameter wrapped in a list
+        """
+        variable = self.model_description_dict[parameter_name]
+        return functions[variable.type], [variable.valueReference]
+
     def do_step(self, time: float, step_size: float) -> None:
         """Perform a simulation step.
 
@@ -177,3 +264,25 @@ class Fmu(SimulationEntity):
     def get_dtype_of_parameter(self, parameter_name: str) -> type:
         dtype: type = self.model_description_dict[parameter_name]._python_type
         return dtype
+
+
+@lru_cache(maxsize=32)
+def _read_model_description(
+    fmu_path: str, mtime_ns: int, size: int
+) -> ModelDescription:
+    """Read the model description of a fmu.
+
+    Parsing the xml is cached, so repeated simulations of the same fmu read it only
+    once. The modification time and size are part of the cache key, so a
+    re-exported fmu is read again. The returned model description must not be
+    modified.
+
+    Args:
+        fmu_path (str): Path to the fmu.
+        mtime_ns (int): Modification time of the fmu in nanoseconds.
+        size (int): Size of the fmu in bytes.
+
+    Returns:
+        ModelDescription: Model description of the fmu.
+    """
+    return read_model_description(fmu_path)
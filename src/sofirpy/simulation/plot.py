@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import cast
 
 import matplotlib.axes
 import matplotlib.figure
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 
@@ -19,6 +21,7 @@ def plot_results(
     title: str | None = None,
     legend: str | list[str] | None = None,
     style_sheet_path: str | Path | None = None,
+    axes: matplotlib.axes.Axes | None = None,
 ) -> tuple[matplotlib.axes.Axes, matplotlib.figure.Figure]:
     """Plot the simulation results.
 
@@ -34,6 +37,9 @@ def plot_results(
             plots give a list of strings as the argument. Defaults to None.
         style_sheet_path (str | Path | None, optional): Path to a matplotlib
             style sheet. Defaults to None.
+        axes (matplotlib.axes.Axes | None, optional): Axes to plot into. This allows
+            to reuse a figure for several plots instead of creating a new one each
+            time. If None a new figure is created. Defaults to None.
 
     Returns:
         tuple[Axes, Figure]: Matplotlib Axes and figure object.
@@ -41,8 +47,11 @@ def plot_results(
     if style_sheet_path:
         plt.style.use(style_sheet_path)
 
-    figure = plt.figure()
-    axes = plt.gca()
+    if axes is None:
+        figure = plt.figure()
+        axes = figure.gca()
+    else:
+        figure = cast(matplotlib.figure.Figure, axes.get_figure())
 
     if title:
         axes.set_title(title)
@@ -50,11 +59,12 @@ def plot_results(
         axes.set_xlabel(x_label)
     if y_label:
         axes.set_ylabel(y_label)
-    if isinstance(y_name, list):
-        for name in y_name:
-            axes.plot(results[x_name], results[name])
-    else:
-        axes.plot(results[x_name], results[y_name])
+    # a list of names selects a 2D array, whose columns are plotted in one call;
+    # nullable columns are converted to float with NaN for missing values
+    axes.plot(
+        results[x_name].to_numpy(),
+        results[y_name].to_numpy(dtype=float, na_value=np.nan),
+    )
     if legend:
         axes.legend(legend)
 
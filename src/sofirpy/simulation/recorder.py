@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import ExitStack
+from functools import cached_property
+from typing import Any, TypeVar
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+from typing_extensions import Self
 
 import sofirpy.common as co
+from sofirpy.rdm.hdf5.hdf5 import HDF5
 from sofirpy.simulation.components import System, SystemParameter
 
+Column = TypeVar("Column")
+
 
 class BaseRecorder(ABC):
     def __init__(
@@ -22,6 +28,39 @@ class BaseRecorder(ABC):
         self.systems = systems
         self.recorder_config = recorder_config
 
+    def _group_columns_by_system(
+        self, columns: list[Column]
+    ) -> list[tuple[co.ParametersGetter, tuple[str, ...], list[Column]]]:
+        """Group the columns of the logged parameters by their system.
+
+        This allows the values of all logged parameters of a system to be obtained
+        with a single call.
+
+        Args:
+            columns (list[Column]): Column for each parameter to be logged, in the
+                order of parameters_to_log.
+
+        Returns:
+            list[tuple[co.ParametersGetter, tuple[str, ...], list[Column]]]: For each
+            system the getter for multiple parameter values, the names of the logged
+            parameters and the corresponding columns.
+        """
+        groups: dict[str, tuple[list[str], list[Column]]] = {}
+        for parameter, column in zip(self.parameters_to_log, columns):
+            parameter_names, system_columns = groups.setdefault(
+                parameter.system_name, ([], [])
+            )
+            parameter_names.append(parameter.name)
+            system_columns.append(column)
+        return [
+            (
+                self.systems[system_name].simulation_entity.get_parameter_values,
+                tuple(parameter_names),
+                system_columns,
+            )
+            for system_name, (parameter_names, system_columns) in groups.items()
+        ]
+
     @abstractmethod
     def record(self, time: float, time_step: int) -> None:
         """Record specified parameters of the systems.
@@ -34,6 +73,19 @@ class BaseRecorder(ABC):
     @abstractmethod
     def to_pandas(self) -> pd.DataFrame: ...
 
+    def close(self) -> None:  # noqa: B027
+        """Release the resources of the recorder.
+
+        Called when the simulation ends, also if it failed. The recorded data stays
+        available through to_pandas.
+        """
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
     def get_log_name(self, system_name: str, parameter_name: str) -> str:
         """Return the log name of a parameter.
 
@@ -49,20 +101,36 @@ class BaseRecorder(ABC):
         """
         return f"{system_name}.{parameter_name}"
 
+    @cached_property
+    def log_names(self) -> list[str]:
+        """Log names of the parameters to be logged.
+
+        Returns:
+            list[str]: Log names in the order of parameters_to_log, see
+            get_log_name.
+        """
+        return [
+            self.get_log_name(parameter.system_name, parameter.name)
+            for parameter in self.parameters_to_log
+        ]
+
     def get_dtypes(self) -> dict[str, type[Any]]:
         """Get the dtypes of the parameters to be logged.
 
+        Float parameters are logged with the dtype given by the 'float_dtype' key of
+        the recorder_config, e.g. np.float32 to halve the memory of the results at
+        the cost of precision. The time is always logged as float64.
+
         Returns:
             dict[str, type[Any]]: Dtypes of the parameters to be logged.
             key -> full parameter name; value -> dtype
         """
-        dtypes = {"time": float}
-        for parameter in self.parameters_to_log:
-            system_name = parameter.system_name
-            system = self.systems[system_name]
-            parameter_name = parameter.name
-            dtype = system.simulation_entity.get_dtype_of_parameter(parameter_name)
-            dtypes[self.get_log_name(system_name, parameter_name)] = dtype
+        float_dtype: type[Any] = (self.recorder_config or {}).get("float_dtype", float)
+        dtypes: dict[str, type[Any]] = {"time": float}
+        for parameter, log_name in zip(self.parameters_to_log, self.log_names):
+            system = self.systems[parameter.system_name]
+            dtype = system.simulation_entity.get_dtype_of_parameter(parameter.name)
+            dtypes[log_name] = float_dtype if dtype is float else dtype
         return dtypes
 
 
@@ -75,14 +143,16 @@ class VariableSizeRecorder(BaseRecorder):
     ) -> None:
         super().__init__(parameters_to_log, systems, recorder_config)
         self.log = self._init_log()
+        self._time_column = self.log["time"]
+        self._system_columns = self._group_columns_by_system(
+            [self.log[log_name] for log_name in self.log_names]
+        )
 
     def _init_log(self) -> dict[str, list[co.ParameterValue]]:
         log: dict[str, list[co.ParameterValue]] = {}
         log["time"] = []
-        for system_parameter in self.parameters_to_log:
-            log[
-                self.get_log_name(system_parameter.system_name, system_parameter.name)
-            ] = []
+        for log_name in self.log_names:
+            log[log_name] = []
         return log
 
     def record(self, time: float, time_step: int = 0) -> None:
@@ -92,15 +162,10 @@ class VariableSizeRecorder(BaseRecorder):
             time (float): Current simulation time
             time_step (int): Current time step
         """
-        self.log["time"].append(time)
-        for system_parameter in self.parameters_to_log:
-            value = self.systems[
-                system_parameter.system_name
-            ].simulation_entity.get_parameter_value(system_parameter.name)
-            log_name = self.get_log_name(
-                system_parameter.system_name, system_parameter.name
-            )
-            self.log[log_name].append(value)
+        self._time_column.append(time)
+        for get_parameter_values, parameter_names, columns in self._system_columns:
+            for column, value in zip(columns, get_parameter_values(parameter_names)):
+                column.append(value)
 
     def to_pandas(self) -> pd.DataFrame:
         """Convert the logged data to a pandas DataFrame.
@@ -127,41 +192,45 @@ class FixedSizedRecorder(BaseRecorder):
             )
         self.stop_time: float = self.recorder_config["stop_time"]
         self.step_size: float = self.recorder_config["step_size"]
+        self.start_time: float = self.recorder_config.get("start_time", 0.0)
         self.logging_step_size: float = self.recorder_config.get(
-            "logging_step_size", "step_size"
+            "logging_step_size", self.step_size
+        )
+        self.logging_multiple: int = round(self.logging_step_size / self.step_size)
+        dtypes = list(self.get_dtypes().items())
+        self.log: npt.NDArray[np.void] = np.zeros(
+            self._get_number_log_steps(), dtype=dtypes
+        )
+        self._time_column = self.log["time"]
+        self._system_columns = self._group_columns_by_system(
+            [self.log[log_name] for log_name in self.log_names]
         )
-        self.logging_multiple = round(self.logging_step_size / self.step_size)
-        number_log_steps = int(self.stop_time / self.logging_step_size) + 1
-        dtypes = self._get_numpy_dtypes()
-        self.log: npt.NDArray[np.void] = np.zeros(number_log_steps, dtype=dtypes)
         self.log_step = 0
 
-    def _get_numpy_dtypes(self) -> npt.DTypeLike:
-        """Get the dtypes of the logged parameters.
+    def _get_number_log_steps(self) -> int:
+        """Get the number of time steps that are logged.
+
+        The number of simulation steps is computed the same way as the time array of
+        the simulation. Dividing the stop time by the logging step size directly can
+        be off by one due to floating point errors, e.g. 0.3 / 0.1 < 3.
 
         Returns:
-            np.dtypes.VoidDType: dtypes of the logged parameters
+            int: Number of time steps that are logged
         """
-        dtypes: list[tuple[str, type]] = [("time", np.float64)]
-        for parameter in self.parameters_to_log:
-            system_name = parameter.system_name
-            system = self.systems[system_name]
-            parameter_name = parameter.name
-            dtype = system.simulation_entity.get_dtype_of_parameter(parameter_name)
-            dtypes.append((f"{system.name}.{parameter_name}", dtype))
-        return np.dtype(dtypes)
+        number_of_steps = int(
+            round((self.stop_time - self.start_time) / self.step_size, 10)
+        )
+        return number_of_steps // self.logging_multiple + 1
 
     def record(self, time: float, time_step: int) -> None:
         if (time_step % self.logging_multiple) != 0:
             return
-        self.log[self.log_step][0] = time
-        for i, parameter in enumerate(self.parameters_to_log, start=1):
-            system_name = parameter.system_name
-            system = self.systems[system_name]
-            parameter_name = parameter.name
-            value = system.simulation_entity.get_parameter_value(parameter_name)
-            self.log[self.log_step][i] = value
-        self.log_step += 1
+        log_step = self.log_step
+        self._time_column[log_step] = time
+        for get_parameter_values, parameter_names, columns in self._system_columns:
+            for column, value in zip(columns, get_parameter_values(parameter_names)):
+                column[log_step] = value
+        self.log_step = log_step + 1
 
     def to_pandas(self) -> pd.DataFrame:
         """Covert result numpy array to DataFrame.
@@ -170,3 +239,103 @@ class FixedSizedRecorder(BaseRecorder):
             get_log_name method. By default '<system_name>.<parameter_name>'.
         """
         return pd.DataFrame(self.log)
+
+
+class HDF5Recorder(BaseRecorder):
+    """Recorder that streams the logged values into a hdf5 dataset.
+
+    The values are buffered and appended to a resizable, chunked dataset each time
+    'chunk_size' records are collected. Memory usage therefore does not grow with
+    the length of the simulation. The hdf5 file stays open until close is called,
+    e.g. by using the recorder as a context manager. The recorder_config has the
+    following keys:
+
+    - 'hdf5_path': Path to the hdf5 file (required)
+    - 'dataset_path': Path of the dataset inside the hdf5 file. Defaults to
+      'results'.
+    - 'chunk_size': Number of records that are buffered before they are written.
+      Defaults to 1024.
+    - 'float_dtype': Dtype float parameters are stored with. Defaults to float64.
+    - 'compression': Compression filter of the dataset, e.g. "gzip". Defaults to
+      None.
+    """
+
+    def __init__(
+        self,
+        parameters_to_log: list[SystemParameter],
+        systems: dict[str, System],
+        recorder_config: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(parameters_to_log, systems, recorder_config)
+        if self.recorder_config is None or "hdf5_path" not in self.recorder_config:
+            raise ValueError(
+                "For HDF5Recorder 'hdf5_path' needs to be defined in the "
+                "recorder_config."
+            )
+        self.hdf5 = HDF5(self.recorder_config["hdf5_path"])
+        self.group_path, _, self.dataset_name = self.recorder_config.get(
+            "dataset_path", "results"
+        ).rpartition("/")
+        self.chunk_size: int = self.recorder_config.get("chunk_size", 1024)
+        dtypes = self.get_dtypes()
+        self._buffer: npt.NDArray[np.void] = np.zeros(
+            self.chunk_size, dtype=list(dtypes.items())
+        )
+        self._time_column = self._buffer["time"]
+        self._system_columns = self._group_columns_by_system(
+            [self._buffer[name] for name in list(dtypes)[1:]]
+        )
+        self._buffer_step = 0
+        self._session = ExitStack()
+        self._session.enter_context(self.hdf5)
+        self.hdf5.store_data(
+            self._buffer[:0],
+            self.dataset_name,
+            self.group_path,
+            compression=self.recorder_config.get("compression"),
+            maxshape=(None,),
+        )
+
+    def record(self, time: float, time_step: int = 0) -> None:
+        """Record specified parameters of the systems.
+
+        Args:
+            time (float): Current simulation time
+            time_step (int): Current time step
+        """
+        buffer_step = self._buffer_step
+        self._time_column[buffer_step] = time
+        for get_parameter_values, parameter_names, columns in self._system_columns:
+            for column, value in zip(columns, get_parameter_values(parameter_names)):
+                column[buffer_step] = value
+        self._buffer_step = buffer_step + 1
+        if self._buffer_step == self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the buffered records to the hdf5 dataset."""
+        if self._buffer_step == 0:
+            return
+        self.hdf5.append_data(
+            self._buffer[: self._buffer_step], self.dataset_name, self.group_path
+        )
+        self._buffer_step = 0
+
+    def close(self) -> None:
+        """Flush the buffer and close the hdf5 file."""
+        try:
+            self.flush()
+        finally:
+            self._session.close()
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Flush the buffer and read the recorded data from the hdf5 file.
+
+        Returns:
+            pd.DataFrame: Recorded data as a pandas DataFrame
+        """
+        self.flush()
+        results: pd.DataFrame = pd.DataFrame(
+            self.hdf5.read_data(self.dataset_name, self.group_path)
+        )
+        return results
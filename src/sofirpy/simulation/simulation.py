@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Literal, overload
+from typing import Any, Final, Literal, overload
 
 import numpy as np
 import numpy.typing as npt
@@ -21,6 +22,14 @@ from sofirpy.simulation.recorder import (
     VariableSizeRecorder,
 )
 
+# Number of times the progress bar is refreshed during a simulation. Updating the
+# bar every single step adds terminal output proportional to the number of steps.
+_PROGRESS_UPDATES = 500
+
+
+def _skip_systems_inputs() -> None:
+    """Stand in for set_systems_inputs in simulations without connections."""
+
 
 class BaseSimulator:
     def __init__(
@@ -47,6 +56,10 @@ class BaseSimulator:
         self.systems = init_systems(simulation_entity_mapping, config.init_configs)
         self.connections = init_connections(config.connections)
         self.parameters_to_log = init_parameter_list(config.parameters_to_log or {})
+        self._do_step_functions = [
+            system.simulation_entity.do_step for system in self.systems.values()
+        ]
+        self._init_connection_plan()
         _recorder = recorder or VariableSizeRecorder
         self.recorder = _recorder(self.parameters_to_log, self.systems, recorder_config)
         self.time: float = 0.0
@@ -59,22 +72,41 @@ class BaseSimulator:
             time (float): current simulation time
             step_size (float): step size of the simulation
         """
-        for system in self.systems.values():
-            system.simulation_entity.do_step(time, step_size)
+        for do_step in self._do_step_functions:
+            do_step(time, step_size)
 
     def set_systems_inputs(self) -> None:
         """Set inputs for all systems."""
+        for set_parameter, input_name, get_parameter_value, output_name in zip(
+            self._input_setters,
+            self._input_names,
+            self._output_getters,
+            self._output_names,
+        ):
+            set_parameter(input_name, get_parameter_value(output_name))
+
+    def _init_connection_plan(self) -> None:
+        """Resolve the methods and parameter names of all connections once.
+
+        The connections are flattened into four parallel tuples, holding for each
+        connection the setter of the input system, the input name, the getter of the
+        output system and the output name.
+        """
+        input_setters: list[co.ParameterSetter] = []
+        input_names: list[str] = []
+        output_getters: list[co.ParameterGetter] = []
+        output_names: list[str] = []
         for connection in self.connections:
-            input_system_name = connection.input_point.system_name
-            input_system = self.systems[input_system_name]
-            input_name = connection.input_point.name
-            output_system_name = connection.output_point.system_name
-            output_system = self.systems[output_system_name]
-            output_name = connection.output_point.name
-            input_value = output_system.simulation_entity.get_parameter_value(
-                output_name,
-            )
-            input_system.simulation_entity.set_parameter(input_name, input_value)
+            input_system = self.systems[connection.input_point.system_name]
+            output_system = self.systems[connection.output_point.system_name]
+            input_setters.append(input_system.simulation_entity.set_parameter)
+            input_names.append(connection.input_point.name)
+            output_getters.append(output_system.simulation_entity.get_parameter_value)
+            output_names.append(connection.output_point.name)
+        self._input_setters = tuple(input_setters)
+        self._input_names = tuple(input_names)
+        self._output_getters = tuple(output_getters)
+        self._output_names = tuple(output_names)
 
     def get_parameter(self, system_name: str, parameter_name: str) -> co.ParameterValue:
         """Get the value of a parameter in a system.
@@ -115,15 +147,27 @@ class BaseSimulator:
             not be obtained it is set to None.
         """
         units = {}
-        for parameter in self.parameters_to_log:
-            system_name = parameter.system_name
-            system = self.systems[system_name]
-            parameter_name = parameter.name
-            unit = system.simulation_entity.get_unit(parameter_name)
-            units[f"{system.name}.{parameter_name}"] = unit
+        for system_name, parameters in self._group_logged_parameters().items():
+            get_unit = self.systems[system_name].simulation_entity.get_unit
+            for parameter_name, log_name in parameters:
+                units[log_name] = get_unit(parameter_name)
 
         return units
 
+    def _group_logged_parameters(self) -> dict[str, list[tuple[str, str]]]:
+        """Group the logged parameters by the system they belong to.
+
+        Returns:
+            dict[str, list[tuple[str, str]]]: keys -> system name; values -> list of
+            parameter names and log names
+        """
+        parameters_by_system: dict[str, list[tuple[str, str]]] = {}
+        for parameter, log_name in zip(self.parameters_to_log, self.recorder.log_names):
+            parameters_by_system.setdefault(parameter.system_name, []).append(
+                (parameter.name, log_name)
+            )
+        return parameters_by_system
+
 
 class Simulator(BaseSimulator):
     """Object that performs the simulation."""
@@ -138,6 +182,7 @@ class Simulator(BaseSimulator):
         connections_config: co.ConnectionsConfig | None = None,
         init_configs: co.InitConfigs | None = None,
         parameters_to_log: co.ParametersToLog | None = None,
+        float_dtype: type[np.floating[Any]] = np.float64,
     ) -> None:
         extended_simulation_config = ExtendedSimulationConfig(
             stop_time=stop_time,
@@ -159,6 +204,8 @@ class Simulator(BaseSimulator):
                 "stop_time": self.stop_time,
                 "step_size": self.step_size,
                 "logging_step_size": self.logging_step_size,
+                "start_time": self.start_time,
+                "float_dtype": float_dtype,
             },
         )
 
@@ -170,10 +217,10 @@ class Simulator(BaseSimulator):
         The following steps are performed.
 
         1. A time array is created starting from 0 to the specified stop time. The
-           intervals have the size of the step size. If the last element in the array
-           is greater than the stop time, it is deleted. Advancing in time this way,
-           leads to less numerical errors in comparison than using a while loop and
-           adding the step size in each iteration.
+           intervals have the size of the step size. The number of steps is computed
+           once and every time is calculated as a multiple of the step size. Advancing
+           in time this way, leads to less numerical errors in comparison than using a
+           while loop and adding the step size in each iteration.
 
         2. The logging multiple is calculated from the logging step size. Since the
            logging step size needs to be a multiple of the step size, the logging
@@ -195,7 +242,8 @@ class Simulator(BaseSimulator):
            5.3 If the time step + 1 is a multiple of the logging multiple, values are
            logged.
 
-        6. The simulation process is concluded.
+        6. The recorder is closed, also if the simulation failed. Then the
+           simulation process is concluded.
 
         7. The numpy results object is converted to a pandas DataFrame.
 
@@ -213,11 +261,34 @@ class Simulator(BaseSimulator):
         )
         logging.info("Starting simulation.")
 
-        for time_step, time in enumerate(tqdm(time_series[:-1])):
-            self.recorder.record(time=time, time_step=time_step)
-            self.do_step(time, self.step_size)
-            self.set_systems_inputs()
-        self.recorder.record(time_series[-1], time_step + 1)
+        # plain floats are indexed and passed on faster than numpy scalars
+        times: list[float] = time_series.tolist()
+        number_of_steps = len(times) - 1
+        report_every = max(1, number_of_steps // _PROGRESS_UPDATES)
+        record = self.recorder.record
+        do_step = self.do_step
+        set_systems_inputs: Callable[[], None] = self.set_systems_inputs
+        # without connections there are no inputs to exchange, unless a subclass
+        # sets inputs of its own
+        if (
+            not self._input_setters
+            and type(self).set_systems_inputs is BaseSimulator.set_systems_inputs
+        ):
+            set_systems_inputs = _skip_systems_inputs
+        step_size = self.step_size
+        try:
+            with tqdm(total=number_of_steps, disable=None) as progress_bar:
+                for block_start in range(0, number_of_steps, report_every):
+                    block_end = min(block_start + report_every, number_of_steps)
+                    for time_step in range(block_start, block_end):
+                        time = times[time_step]
+                        record(time, time_step)
+                        do_step(time, step_size)
+                        set_systems_inputs()
+                    progress_bar.update(block_end - block_start)
+            self.recorder.record(times[-1], number_of_steps)
+        finally:
+            self.recorder.close()
 
         logging.info("Simulation done.")
         logging.info("Concluding simulation.")
@@ -242,10 +313,8 @@ class Simulator(BaseSimulator):
         Returns:
             npt.NDArray[np.float64]: time array
         """
-        time_series = np.arange(start_time, stop_time + step_size, step_size)
-        if time_series[-1] > stop_time:
-            return time_series[:-1]
-        return time_series
+        number_of_steps = int(round((stop_time - start_time) / step_size, 10))
+        return start_time + step_size * np.arange(number_of_steps + 1, dtype=np.float64)
 
 
 @overload
@@ -260,6 +329,7 @@ def simulate(
     logging_step_size: float | None = ...,
     *,
     get_units: Literal[True],
+    float_dtype: type[np.floating[Any]] = ...,
 ) -> tuple[pd.DataFrame, co.Units]: ...
 
 
@@ -275,6 +345,7 @@ def simulate(
     logging_step_size: float | None = ...,
     *,
     get_units: Literal[False],
+    float_dtype: type[np.floating[Any]] = ...,
 ) -> pd.DataFrame: ...
 
 
@@ -288,6 +359,8 @@ def simulate(
     init_configs: co.InitConfigs | None = ...,
     parameters_to_log: co.ParametersToLog | None = ...,
     logging_step_size: float | None = ...,
+    *,
+    float_dtype: type[np.floating[Any]] = ...,
 ) -> pd.DataFrame: ...
 
 
@@ -301,6 +374,8 @@ def simulate(
     parameters_to_log: co.ParametersToLog | None = None,
     logging_step_size: float | None = None,
     get_units: bool = False,
+    *,
+    float_dtype: type[np.floating[Any]] = np.float64,
 ) -> pd.DataFrame | tuple[pd.DataFrame, co.Units]:
     """Simulate fmus and models written in python.
 
@@ -426,6 +501,10 @@ def simulate(
             is set to 2e-3, every second time step is logged. Defaults to None.
         get_units (bool, optional): Determines whether the units of
             the logged parameter should be returned. Defaults to False.
+        float_dtype (type[np.floating[Any]], optional): Data type float
+            parameters are logged with. np.float32 halves the memory of the results
+            at the cost of precision. The time is always logged as float64.
+            Defaults to np.float64.
 
     Returns:
         pd.DataFrame | tuple[pd.DataFrame, co.Units]:
@@ -447,6 +526,7 @@ def simulate(
         stop_time=stop_time,
         step_size=step_size,
         logging_step_size=logging_step_size,
+        float_dtype=float_dtype,
     )
     results = simulator.simulate()
 
@@ -481,16 +561,19 @@ def init_connections(connections_config: co.ConnectionsConfig) -> list[Connectio
         list[Connection]: List of Connections.
     """
     all_connections: list[Connection] = []
+    input_parameter_key: Final = co.ConnectionKeys.INPUT_PARAMETER.value
+    connected_system_key: Final = co.ConnectionKeys.CONNECTED_SYSTEM.value
+    output_parameter_key: Final = co.ConnectionKeys.OUTPUT_PARAMETER.value
 
     for this_system_name, connections in connections_config.items():
         for con in connections:
-            this_parameter_name = con[co.ConnectionKeys.INPUT_PARAMETER.value]
+            this_parameter_name = con[input_parameter_key]
             this_connection_point = SystemParameter(
                 this_system_name,
                 this_parameter_name,
             )
-            other_system_name = con[co.ConnectionKeys.CONNECTED_SYSTEM.value]
-            other_parameter_name = con[co.ConnectionKeys.OUTPUT_PARAMETER.value]
+            other_system_name = con[connected_system_key]
+            other_parameter_name = con[output_parameter_key]
             other_connection_point = SystemParameter(
                 other_system_name,
                 other_parameter_name,
@@ -514,21 +597,17 @@ def init_parameter_list(parameters_to_log: co.ParametersToLog) -> list[SystemPar
         list[SystemParameter]: List of system parameters that should be
         logged.
     """
-    log: list[SystemParameter] = []
-
-    for system_name, parameter_names in parameters_to_log.items():
-        for parameter_name in parameter_names:
-            parameter_to_log = SystemParameter(system_name, parameter_name)
-            log.append(parameter_to_log)
-
-    return log
+    return [
+        SystemParameter(system_name, parameter_name)
+        for system_name, parameter_names in parameters_to_log.items()
+        for parameter_name in parameter_names
+    ]
 
 
 def _extract_fmu_init_configs(
     fmu_paths: dict[str, Path],
     init_config: co.InitConfig,
 ) -> tuple[dict[str, Any], co.SimulationEntityMapping]:
-    fmu_classes: co.SimulationEntityMapping = {}
     for fmu_name, fmu_path in fmu_paths.items():
         fmu_init_config: dict[str, Any] = init_config.get(fmu_name, {})
         init_config[fmu_name] = FmuInitConfig(
@@ -536,5 +615,5 @@ def _extract_fmu_init_configs(
             name=fmu_name,
             start_values=fmu_init_config.get(co.StartValueConfigLabel, {}),
         ).model_dump()
-        fmu_classes[fmu_name] = Fmu
+    fmu_classes: co.SimulationEntityMapping = dict.fromkeys(fmu_paths, Fmu)
     return init_config, fmu_classes
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 import sofirpy.common as co
@@ -41,6 +42,24 @@ class SimulationEntity(ABC):
             ParameterValue: value of the parameter
         """
 
+    def get_parameter_values(
+        self, parameter_names: Sequence[str]
+    ) -> list[co.ParameterValue]:
+        """Return the values of multiple parameters.
+
+        Override this method if the values of several parameters can be obtained
+        more efficiently at once than one by one.
+
+        Args:
+            parameter_names (Sequence[str]): names of the parameters whose values
+                are to be obtained
+
+        Returns:
+            list[ParameterValue]: values of the parameters in the given order
+        """
+        get_parameter_value = self.get_parameter_value
+        return [get_parameter_value(name) for name in parameter_names]
+
     @abstractmethod
     def do_step(self, time: float, step_size: float) -> None:
         """Perform a simulation step.
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import errno
 import os
 import re
 import shutil
+import stat
 from importlib.metadata import distributions
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, get_args
 
 import sofirpy.common as co
 
@@ -29,15 +31,21 @@ def delete_file_or_directory(
     Raises:
         ValueError: 'path' doesn't exist and 'must_exist' is set to True.
     """
-    if not path.exists():
+    # files and symbolic links are unlinked directly, so the common case needs a
+    # single system call; a link is removed itself, never the directory it
+    # points to
+    try:
+        path.unlink()
+    except FileNotFoundError:
         if not must_exist:
             return
-        raise FileNotFoundError(f"{path!s} does not exist")
-
-    if path.is_dir():
+        raise FileNotFoundError(f"{path!s} does not exist") from None
+    except (IsADirectoryError, PermissionError):
+        # unlinking a directory fails with EISDIR on Linux and EPERM/EACCES on
+        # macOS and Windows
+        if not path.is_dir():
+            raise
         shutil.rmtree(str(path), ignore_errors=True)
-    else:
-        path.unlink()
 
     if print_status:
         print(f"{path!s} has been deleted")
@@ -85,18 +93,23 @@ def move_file(source_path: Path, target_path: Path) -> None:
         FileNotFoundError: 'source_path' doesn't exist.
         FileExistsError: 'target_path' does already exist.
     """
-    if source_path == target_path:
-        return
     if not source_path.exists():
         raise FileNotFoundError(f"{source_path} does not exits.")
+    if source_path == target_path:
+        return
     if target_path.exists():
         overwrite = get_user_input_for_overwriting(target_path)
         if not overwrite:
             raise FileExistsError(f"{target_path} already exists")
-    if not target_path.parent.exists():
-        target_path.parent.mkdir(parents=True)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
 
-    source_path.replace(target_path)
+    try:
+        source_path.replace(target_path)
+    except OSError as error:
+        # a rename is not possible across file systems, fall back to copying
+        if error.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source_path), str(target_path))
 
 
 def move_files(source_paths: list[Path], target_directory: Path) -> None:
@@ -123,9 +136,11 @@ def copy_file(source_path: Path, target_path: Path) -> None:
         IsADirectoryError: 'source_path' is a directory.
         FileExistsError: 'target_path' does already exist.
     """
-    if not source_path.exists():
-        raise FileNotFoundError(f"{source_path} does not exits.")
-    if not source_path.is_file():
+    try:
+        mode = source_path.stat().st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{source_path} does not exits.") from None
+    if not stat.S_ISREG(mode):
         raise IsADirectoryError(f"{source_path} is a directory; expected file")
     if source_path == target_path:
         return
@@ -133,18 +148,43 @@ def copy_file(source_path: Path, target_path: Path) -> None:
         overwrite = get_user_input_for_overwriting(target_path)
         if not overwrite:
             raise FileExistsError(f"{target_path} already exists")
-    if not target_path.parent.exists():
-        target_path.parent.mkdir(parents=True)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
 
     shutil.copy(source_path, target_path)
 
 
+OverwritePolicy = Literal["ask", "overwrite", "error"]
+_overwrite_policy: OverwritePolicy = "ask"
+
+
+def set_overwrite_policy(policy: OverwritePolicy) -> None:
+    """Set how existing paths are handled when they would be overwritten.
+
+    Args:
+        policy (OverwritePolicy): 'ask' prompts the user and refuses to overwrite
+            if no input can be read, 'overwrite' always overwrites and 'error'
+            never overwrites.
+
+    Raises:
+        ValueError: policy was invalid
+    """
+    global _overwrite_policy
+    if policy not in get_args(OverwritePolicy):
+        raise ValueError(
+            f"'policy' is {policy!r}; expected one of {get_args(OverwritePolicy)}"
+        )
+    _overwrite_policy = policy
+
+
 def get_user_input_for_overwriting(
     target_path: co.FilePath,
     typ: str = "path",
 ) -> bool:
     """Get user input for overwriting a path.
 
+    The user is only prompted if the overwrite policy is 'ask'. If no input can be
+    read, e.g. because the standard input is closed, the path is not overwritten.
+
     Args:
         target_path (co.FilePath): Path that should be overwritten.
         typ (str, optional): Name of the path. Defaults to "path".
@@ -152,8 +192,15 @@ def get_user_input_for_overwriting(
     Returns:
         bool: True if path should be overwritten, else False
     """
+    if _overwrite_policy != "ask":
+        return _overwrite_policy == "overwrite"
     while True:
-        overwrite = input(f"The {typ} {target_path} already exists. Overwrite? [y/n]")
+        try:
+            overwrite = input(
+                f"The {typ} {target_path} already exists. Overwrite? [y/n]"
+            )
+        except (EOFError, OSError):
+            return False
         if overwrite == "y":
             return True
         if overwrite == "n":
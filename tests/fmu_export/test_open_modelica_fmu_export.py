@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from sofirpy.fmu_export.open_modelica_fmu_export import OpenModelicaFmuExport
+
+
+@pytest.fixture
+def model_path() -> Path:
+    return Path(__file__).parent / "DC_Motor.mo"
+
+
+def test_delete_build_artifacts(
+    model_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    artifacts = [tmp_path / "DC_Motor.c", tmp_path / "DC_Motor_FMU.log"]
+    for artifact in artifacts:
+        artifact.touch()
+    (tmp_path / "other.c").touch()
+    with OpenModelicaFmuExport(model_path, "DC_Motor"):
+        pass
+    assert not any(artifact.exists() for artifact in artifacts)
+    assert (tmp_path / "other.c").exists()
+
+
+def test_failed_cleanup_keeps_original_error(
+    model_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail() -> None:
+        raise PermissionError
+
+    monkeypatch.chdir(tmp_path)
+    exporter = OpenModelicaFmuExport(model_path, "DC_Motor")
+    monkeypatch.setattr(exporter, "delete_build_artifacts", fail)
+    with pytest.raises(RuntimeError), exporter:
+        raise RuntimeError
@@ -2,6 +2,7 @@ import shutil
 import tempfile
 from pathlib import Path
 
+import h5py
 import numpy as np
 import pytest
 
@@ -75,6 +76,12 @@ def test_create_group_exception(hdf5: h5.HDF5, group: str) -> None:
         hdf5.create_group(group)
 
 
+def test_create_group_exist_ok(hdf5: h5.HDF5) -> None:
+    group = "test_create_group_exception/group1"
+    hdf5.create_group(group, attributes={"test": 1}, exist_ok=True)
+    assert hdf5.read_attributes(group)["test"] == 1
+
+
 @pytest.mark.parametrize(
     "group",
     [
@@ -162,6 +169,69 @@ def test_store_data(hdf5: h5.HDF5) -> None:
     assert (_data == data).all()
 
 
+def test_store_data_compression(hdf5: h5.HDF5) -> None:
+    data = np.repeat(np.arange(100, dtype=np.float64), 100)
+    hdf5.store_data(data, "array", "test_store_data")
+    hdf5.store_data(data, "gzip", "test_store_data", compression="gzip")
+    hdf5.store_data(1.0, "scalar", "test_store_data", compression="gzip")
+    with h5py.File(hdf5.hdf5_path, "r") as file:
+        array = file["test_store_data/array"]
+        assert array.compression is None
+        assert array.chunks is None
+        assert array.id.get_storage_size() == data.nbytes
+        gzip = file["test_store_data/gzip"]
+        assert gzip.compression == "gzip"
+        assert gzip.shuffle
+        assert gzip.id.get_storage_size() < data.nbytes / 10
+        assert file["test_store_data/scalar"].compression is None
+    assert (hdf5.read_data("array", "test_store_data") == data).all()
+    assert (hdf5.read_data("gzip", "test_store_data") == data).all()
+
+
+def test_store_data_with_compression_options(hdf5: h5.HDF5) -> None:
+    data = np.arange(100, dtype=np.float64)
+    hdf5.store_data(
+        data, "gzip", "test_store_data", compression="gzip", compression_opts=4
+    )
+    hdf5.store_data(data, "lzf", "test_store_data", compression="lzf")
+    with h5py.File(hdf5.hdf5_path, "r") as file:
+        assert file["test_store_data/gzip"].compression == "gzip"
+        assert file["test_store_data/gzip"].compression_opts == 4
+        assert file["test_store_data/lzf"].compression == "lzf"
+    assert (hdf5.read_data("lzf", "test_store_data") == data).all()
+
+
+def test_store_data_with_dtype(hdf5: h5.HDF5) -> None:
+    data = np.linspace(0, 1, 100)
+    hdf5.store_data(data, "array", "test_store_data", dtype=np.float32)
+    _data = hdf5.read_data("array", "test_store_data")
+    assert _data.dtype == np.float32
+    assert np.isclose(_data, data).all()
+
+
+def test_append_data(hdf5: h5.HDF5) -> None:
+    data = np.linspace(0, 1, 100)
+    hdf5.store_data(data[:0], "array", "test_append_data", maxshape=(None,))
+    hdf5.append_data(data[:60], "array", "test_append_data")
+    hdf5.append_data(data[60:], "array", "test_append_data")
+    with h5py.File(hdf5.hdf5_path, "r") as file:
+        assert file["test_append_data/array"].maxshape == (None,)
+    assert (hdf5.read_data("array", "test_append_data") == data).all()
+
+
+def test_session(hdf5: h5.HDF5) -> None:
+    data = np.zeros(10)
+    with hdf5 as session:
+        assert session is hdf5
+        hdf5.store_data(data, "test_data", "test_session", attributes={"test": 1})
+        hdf5.append_attributes({"test_2": 2}, "test_session/test_data")
+        assert "test_session/test_data" in hdf5
+    assert hdf5._hdf5_file is None
+    _data, _attr = hdf5.read_data("test_data", "test_session", get_attributes=True)
+    assert (_data == data).all()
+    assert _attr == {"test": 1, "test_2": 2}
+
+
 def test_store_data_with_already_existing_data_set(hdf5: h5.HDF5) -> None:
     pass
 
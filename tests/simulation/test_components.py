@@ -0,0 +1,23 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from sofirpy.simulation.components import Connection, SystemParameter
+
+
+def test_connection_deepcopy_and_pickle() -> None:
+    connection = Connection(
+        SystemParameter("pid", "u"),
+        SystemParameter("DC_Motor", "y"),
+    )
+    assert copy.deepcopy(connection) == connection
+    assert pickle.loads(pickle.dumps(connection)) == connection
+
+
+def test_components_have_no_instance_dict() -> None:
+    parameter = SystemParameter("pid", "u")
+    assert not hasattr(parameter, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        parameter.name = "y"  # type: ignore[misc]
@@ -0,0 +1,32 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from sofirpy.simulation.plot import plot_results
+
+
+def test_plot_results_into_existing_axes() -> None:
+    results = pd.DataFrame({"time": [0.0, 1.0, 2.0], "a": [1, 2, 3], "b": [3, 2, 1]})
+    figure, axes = plt.subplots()
+    _axes, _figure = plot_results(results, "time", ["a", "b"], axes=axes)
+    assert _axes is axes
+    assert _figure is figure
+    assert len(axes.get_lines()) == 2
+    assert list(axes.get_lines()[1].get_ydata()) == [3, 2, 1]
+    plt.close(figure)
+
+
+def test_plot_results_with_nullable_columns() -> None:
+    results = pd.DataFrame(
+        {
+            "time": [0.0, 1.0, 2.0],
+            "a": pd.array([1, None, 3], dtype="Int64"),
+            "b": pd.array([True, None, False], dtype="boolean"),
+        }
+    )
+    axes, figure = plot_results(results, "time", ["a", "b"])
+    assert len(axes.get_lines()) == 2
+    assert np.array_equal(axes.get_lines()[0].get_ydata(), [1, np.nan, 3], True)
+    axes, _ = plot_results(results, "time", "a", axes=axes)
+    assert len(axes.get_lines()) == 3
+    plt.close(figure)
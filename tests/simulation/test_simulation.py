@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import h5py
 import numpy as np
 import pandas as pd
 import pytest
@@ -11,7 +12,14 @@ from sofirpy.common import (
     ModelClasses,
     ParametersToLog,
 )
-from sofirpy.simulation.simulation import BaseSimulator, VariableSizeRecorder, simulate
+from sofirpy.rdm.hdf5.hdf5 import HDF5
+from sofirpy.simulation.recorder import FixedSizedRecorder, HDF5Recorder
+from sofirpy.simulation.simulation import (
+    BaseSimulator,
+    Simulator,
+    VariableSizeRecorder,
+    simulate,
+)
 
 
 @pytest.fixture
@@ -130,6 +138,58 @@ def test_simulate_with_bigger_log_step_size(
     ).all()
 
 
+def test_simulate_with_inexact_number_of_log_steps(
+    connections_config: ConnectionsConfig,
+    fmu_paths: FmuPaths,
+    model_classes: ModelClasses,
+    init_configs: InitConfigs,
+    result_path: Path,
+    parameters_to_log: ParametersToLog,
+) -> None:
+    # 0.3 / 0.1 is slightly less than 3 in floating point arithmetic
+    results = simulate(
+        stop_time=0.3,
+        step_size=1e-3,
+        fmu_paths=fmu_paths,
+        model_classes=model_classes,
+        init_configs=init_configs,
+        connections_config=connections_config,
+        parameters_to_log=parameters_to_log,
+        logging_step_size=0.1,
+    )
+
+    test_results = pd.read_csv(result_path).to_numpy()
+    results = results.to_numpy()
+
+    assert len(results) == 4
+    assert np.isclose(results, test_results[:301:100], atol=1e-6).all()
+
+
+def test_simulate_with_float32_results(
+    connections_config: ConnectionsConfig,
+    fmu_paths: FmuPaths,
+    model_classes: ModelClasses,
+    init_configs: InitConfigs,
+    result_path: Path,
+    parameters_to_log: ParametersToLog,
+) -> None:
+    results = simulate(
+        stop_time=2,
+        step_size=1e-3,
+        fmu_paths=fmu_paths,
+        model_classes=model_classes,
+        init_configs=init_configs,
+        connections_config=connections_config,
+        parameters_to_log=parameters_to_log,
+        float_dtype=np.float32,
+    )
+
+    assert results["time"].dtype == np.float64
+    assert (results.drop(columns="time").dtypes == np.float32).all()
+    test_results = pd.read_csv(result_path).to_numpy()
+    assert np.isclose(results.to_numpy(), test_results, rtol=1e-5, atol=1e-5).all()
+
+
 def test_custom_simulation_loop_with_variable_logger(
     connections_config: ConnectionsConfig,
     fmu_paths: FmuPaths,
@@ -169,3 +229,172 @@ def test_custom_simulation_loop_with_variable_logger(
     test_results = test_results.to_numpy()
     results = results.to_numpy()
     assert np.isclose(results, test_results, atol=1e-6).all()
+
+
+def test_custom_simulation_loop_with_hdf5_recorder(
+    connections_config: ConnectionsConfig,
+    fmu_paths: FmuPaths,
+    model_classes: ModelClasses,
+    init_configs: InitConfigs,
+    result_path: Path,
+    parameters_to_log: ParametersToLog,
+    tmp_path: Path,
+) -> None:
+    simulator = BaseSimulator(
+        fmu_paths=fmu_paths,
+        model_classes=model_classes,
+        init_configs=init_configs,
+        connections_config=connections_config,
+        parameters_to_log=parameters_to_log,
+        recorder=HDF5Recorder,
+        recorder_config={"hdf5_path": tmp_path / "results.hdf5", "chunk_size": 300},
+    )
+    stop_time = 2
+    step_size = 1e-3
+    steps = int(stop_time / step_size)
+    while simulator.step < steps:
+        simulator.recorder.record(simulator.time, simulator.step)
+        simulator.do_step(simulator.time, step_size)
+        simulator.set_systems_inputs()
+        simulator.time += step_size
+        simulator.step += 1
+    simulator.recorder.record(simulator.time, simulator.step)
+    simulator.recorder.close()
+    simulator.conclude_simulation()
+    results = simulator.recorder.to_pandas()
+    test_results = pd.read_csv(result_path)
+    assert list(results.columns) == list(test_results.columns)
+    assert np.isclose(results.to_numpy(), test_results.to_numpy(), atol=1e-6).all()
+
+
+def test_hdf5_recorder_with_existing_dataset(
+    connections_config: ConnectionsConfig,
+    fmu_paths: FmuPaths,
+    model_classes: ModelClasses,
+    init_configs: InitConfigs,
+    parameters_to_log: ParametersToLog,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    hdf5_path = tmp_path / "results.hdf5"
+    HDF5(hdf5_path).store_data([1.0], "results")
+    monkeypatch.setattr("sofirpy.utils._overwrite_policy", "error")
+    with pytest.raises(ValueError, match="already exists"):
+        BaseSimulator(
+            fmu_paths=fmu_paths,
+            model_classes=model_classes,
+            init_configs=init_configs,
+            connections_config=connections_config,
+            parameters_to_log=parameters_to_log,
+            recorder=HDF5Recorder,
+            recorder_config={"hdf5_path": hdf5_path},
+        )
+
+
+def test_get_units_with_recorder_without_base_init(
+    connections_config: ConnectionsConfig,
+    fmu_paths: FmuPaths,
+    model_classes: ModelClasses,
+    init_configs: InitConfigs,
+    parameters_to_log: ParametersToLog,
+) -> None:
+    class CustomRecorder(VariableSizeRecorder):
+        def __init__(self, parameters_to_log, systems, recorder_config=None) -> None:
+            self.parameters_to_log = parameters_to_log
+            self.systems = systems
+            self.recorder_config = recorder_config
+
+    simulator = BaseSimulator(
+        fmu_paths=fmu_paths,
+        model_classes=model_classes,
+        init_configs=init_configs,
+        connections_config=connections_config,
+        parameters_to_log=parameters_to_log,
+        recorder=CustomRecorder,
+    )
+    units = simulator.get_units()
+    assert list(units) == ["DC_Motor.y", "DC_Motor.MotorTorque.tau", "pid.u"]
+    assert list(simulator.recorder.get_dtypes()) == ["time", *units]
+
+
+def test_hdf5_recorder_is_closed_if_simulation_fails(
+    connections_config: ConnectionsConfig,
+    fmu_paths: FmuPaths,
+    model_classes: ModelClasses,
+    init_configs: InitConfigs,
+    parameters_to_log: ParametersToLog,
+    tmp_path: Path,
+) -> None:
+    hdf5_path = tmp_path / "results.hdf5"
+    simulator = BaseSimulator(
+        fmu_paths=fmu_paths,
+        model_classes=model_classes,
+        init_configs=init_configs,
+        connections_config=connections_config,
+        parameters_to_log=parameters_to_log,
+        recorder=HDF5Recorder,
+        recorder_config={"hdf5_path": hdf5_path, "chunk_size": 100},
+    )
+    step_size = 1e-3
+    with pytest.raises(RuntimeError), simulator.recorder:
+        while simulator.step < 2000:
+            simulator.recorder.record(simulator.time, simulator.step)
+            if simulator.step == 250:
+                raise RuntimeError
+            simulator.do_step(simulator.time, step_size)
+            simulator.set_systems_inputs()
+            simulator.time += step_size
+            simulator.step += 1
+    simulator.conclude_simulation()
+    with h5py.File(hdf5_path, "a") as hdf5:
+        assert hdf5["results"].shape == (251,)
+
+
+def test_simulate_closes_recorder_if_simulation_fails(
+    connections_config: ConnectionsConfig,
+    fmu_paths: FmuPaths,
+    model_classes: ModelClasses,
+    init_configs: InitConfigs,
+    parameters_to_log: ParametersToLog,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    closed = []
+
+    def do_step(self: BaseSimulator, time: float, step_size: float) -> None:
+        raise RuntimeError
+
+    monkeypatch.setattr(BaseSimulator, "do_step", do_step)
+    monkeypatch.setattr(FixedSizedRecorder, "close", lambda self: closed.append(1))
+    with pytest.raises(RuntimeError):
+        simulate(
+            stop_time=1,
+            step_size=1e-3,
+            fmu_paths=fmu_paths,
+            model_classes=model_classes,
+            connections_config=connections_config,
+            init_configs=init_configs,
+            parameters_to_log=parameters_to_log,
+        )
+    assert closed == [1]
+
+
+def test_simulate_without_connections_calls_overridden_set_systems_inputs(
+    fmu_paths: FmuPaths,
+    model_classes: ModelClasses,
+    init_configs: InitConfigs,
+) -> None:
+    class CustomSimulator(Simulator):
+        calls = 0
+
+        def set_systems_inputs(self) -> None:
+            self.calls += 1
+
+    simulator = CustomSimulator(
+        stop_time=1,
+        step_size=1e-2,
+        fmu_paths=fmu_paths,
+        model_classes=model_classes,
+        init_configs=init_configs,
+    )
+    simulator.simulate()
+    assert simulator.calls == 100
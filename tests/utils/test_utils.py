@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 import pytest
@@ -28,8 +29,57 @@ def test_delete_file_or_directory(tmp_path: Path) -> None:
     utils.delete_file_or_directory(tmp_path)
 
 
+def test_delete_file_or_directory_symlink_to_directory(tmp_path: Path) -> None:
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    (directory / "test_file.txt").touch()
+    link = tmp_path / "link"
+    link.symlink_to(directory, target_is_directory=True)
+    utils.delete_file_or_directory(link, must_exist=True)
+    assert not link.exists()
+    assert (directory / "test_file.txt").exists()
+
+
 def test_delete_file_or_directory_if_directory_does_not_exist(tmp_path: Path) -> None:
     file_path = tmp_path / "test_file.txt"
     utils.delete_file_or_directory(file_path, must_exist=False)
     with pytest.raises(FileNotFoundError):
         utils.delete_file_or_directory(file_path, must_exist=True)
+
+
+def test_move_file_to_same_path(tmp_path: Path) -> None:
+    file_path = tmp_path / "test_file.txt"
+    with pytest.raises(FileNotFoundError):
+        utils.move_file(file_path, file_path)
+    file_path.touch()
+    utils.move_file(file_path, file_path)
+    assert file_path.exists()
+
+
+def test_get_user_input_for_overwriting_without_terminal(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO("y\n"))
+    assert utils.get_user_input_for_overwriting("test_path") is True
+
+
+def test_get_user_input_for_overwriting_without_input(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO())
+    assert utils.get_user_input_for_overwriting("test_path") is False
+
+
+@pytest.mark.parametrize("policy, expected", [("overwrite", True), ("error", False)])
+def test_overwrite_policy(
+    policy: utils.OverwritePolicy, expected: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(utils, "_overwrite_policy", "ask")
+    monkeypatch.setattr("builtins.input", pytest.fail)
+    utils.set_overwrite_policy(policy)
+    assert utils.get_user_input_for_overwriting("test_path") is expected
+
+
+def test_set_overwrite_policy_error() -> None:
+    with pytest.raises(ValueError):
+        utils.set_overwrite_policy("skip")